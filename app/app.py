@@ -4,19 +4,21 @@ Main dash application.
 from dash import Dash, html
 import dash
 import dash_bootstrap_components as dbc
-import configparser
-from src.utils import Logging, dbc_themes_name_to_url
+import plotly.io as pio
+from src.utils import Logging, dbc_themes_name_to_url, load_config
 import os
 
 ### Configs & Settings ###
 
-config = configparser.ConfigParser()
-config.read("src/config.ini")
+config = load_config()
 
 # get secrets
 PORT = os.environ["PORT"]
 TOKEN = os.environ["TOKEN"]
 
+# serialize figures and store data sent to the client with orjson
+pio.json.config.default_engine = "orjson"
+
 ### Setup Logging ###
 
 Logging.setup()
@@ -40,6 +42,8 @@ app = Dash(
         {"name": "viewport", "content": "width=device-width, initial-scale=1"}
     ],
     suppress_callback_exceptions=True,
+    # gzip responses, store data and figures are large repetitive json
+    compress=True,
 )
 server = app.server
 
@@ -0,0 +1,64 @@
+// Client-side functions for rendering the leaflet markers, referenced
+// from LeafletMapManager through dash_extensions.javascript.Namespace.
+// Colors and sizes are read from the hideout of the GeoJSON component.
+window.tracket = Object.assign({}, window.tracket, {
+    map: {
+        // hover template
+        onEachFeature: function(feature, layer, context) {
+            if (feature.properties.sending_data) {
+                var active = "<b>Active Location</b>";
+            } else {
+                var active = "<b>Inactive Location</b>";
+            };
+            if (feature.properties.label) {
+                var label = feature.properties.label;
+            } else {
+                var label = "";
+            };
+            if (!feature.properties.cluster) {
+                layer.bindTooltip(`${active}<br>${label}`)
+            };
+        },
+        // individual markers on the system map
+        pointToLayerSystemMap: function(feature, latlng, context) {
+            if (feature.properties.sending_data) {
+                var color = context.hideout.color_highlight;
+            } else {
+                var color = context.hideout.color_inactive;
+            };
+            return L.circleMarker(latlng, {
+                radius: context.hideout.radius,
+                fillColor: color,
+                fillOpacity: 0.8,
+            }); // render a simple circle marker
+        },
+        // clusters on the system map
+        clusterToLayer: function(feature, latlng, index, context) {
+            // Modify icon background color.
+            const scatterIcon = L.DivIcon.extend({
+                createIcon: function(oldIcon) {
+                    let icon = L.DivIcon.prototype.createIcon.call(this, oldIcon);
+                    icon.style.backgroundColor = this.options.color;
+                    return icon;
+                }
+            })
+            const leaves = index.getLeaves(feature.properties.cluster_id);
+            var cluster_color = context.hideout.color_inactive;
+            for (let i = 0; i < leaves.length; ++i) {
+                if (leaves[i].properties.sending_data) {
+                    var cluster_color = context.hideout.color_highlight;
+                }
+            }
+            // Render a circle with the number of leaves written in the center.
+            const icon = new scatterIcon({
+                html: '<div style="background-color:white;"><span>' + feature.properties.point_count_abbreviated + '</span></div>',
+                className: "marker-cluster",
+                iconSize: L.point(40, 40),
+                color: cluster_color
+            });
+            return L.marker(latlng, {
+                icon: icon
+            })
+        }
+    }
+});
@@ -57,8 +57,7 @@ def layout(device_id: str = None, **kwargs):
         data_manager.device_id = device_id
 
         # load data for location
-        data_manager.load_and_format_location_stats(location_id=device_id)
-        data_manager.load_and_format_location_info(location_id=device_id)
+        data_manager.load_and_format_location(location_id=device_id)
 
         if data_manager.is_noise_available(location_id=device_id):
             logger.info(f"No noise data available yet at the location.")
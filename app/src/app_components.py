@@ -1,7 +1,6 @@
 from src.utils import (
     COLUMN,
     load_config,
-    get_last_time,
     DataFormatter,
     date_to_string,
 )
@@ -11,12 +10,10 @@ from src.plotting import (
     NumberIndicator,
 )
 from src.data_loading.main import AppDataManager, Granularity
-import plotly.graph_objects as go
 from enum import StrEnum, auto
 import pandas as pd
 import dash_leaflet as dl
-from dash_extensions.javascript import assign
-import dash_leaflet.express as dlx
+from dash_extensions.javascript import Namespace
 from dash import dcc, html, get_asset_url
 import dash_bootstrap_components as dbc
 from typing import List, Dict
@@ -31,7 +28,6 @@ from dash import (
     Patch,
     dash_table,
 )
-import dash
 
 
 class COMPONENT_ID(StrEnum):
@@ -68,6 +64,22 @@ class COMPONENT_ID(StrEnum):
 
 
 class LeafletMapManager:
+    REQUIRED_COLUMNS = frozenset(
+        [
+            COLUMN.LAT,
+            COLUMN.LON,
+            COLUMN.DEVICEID,
+            COLUMN.ACTIVE,
+            COLUMN.LABEL,
+        ]
+    )
+
+    # client-side JS functions for rendering leaflet markers, see assets/map.js
+    _map_js = Namespace("tracket", "map")
+    _on_each_feature = _map_js("onEachFeature")
+    _point_to_layer_system_map = _map_js("pointToLayerSystemMap")
+    _cluster_to_layer = _map_js("clusterToLayer")
+
     def __init__(self) -> None:
         """
         Initialize with the location data.
@@ -76,30 +88,63 @@ class LeafletMapManager:
 
         self.locations = None
 
-        self._assign_clientside_js_functions()
+        # GeoJSON built from the locations, see set_locations()
+        self._system_geojson: Dict[str, object] = None
+        self._system_bounds: List[List[float]] = None
+        self._device_features: Dict[str, Dict[str, object]] = dict()
 
     def set_locations(self, locations: pd.DataFrame) -> None:
+        """
+        Set the locations to show and precompute their GeoJSON.
+        Nothing is rebuilt if the locations did not change since the last call.
+        """
         self._validate_data(locations)
+
+        if self.locations is not None and locations.equals(self.locations):
+            return
+
         self.locations = locations
 
-    def _assign_clientside_js_functions(self) -> None:
-        """
-        Assign JS functions that are used for rendering leaflet markers.
-        """
-        self._assign_on_each_feature()
-        self._assign_point_to_layer_system_map()
-        self._assign_cluster_to_layer()
-        self._assign_point_to_layer_location_map()
+        # the system map needs the sending data flag, single locations don't
+        # only the properties read by the client-side JS are shipped, the
+        # marker color is picked from the sending data flag
+        self._system_geojson = None
+        if COLUMN.SENDING_DATA in locations.columns:
+            self._system_geojson = self._to_geojson(
+                locations,
+                properties=[
+                    COLUMN.DEVICEID,
+                    COLUMN.LABEL,
+                    COLUMN.SENDING_DATA,
+                ],
+            )
+
+        # the system map is fit to all the locations on first render
+        self._system_bounds = None
+        if not locations.empty:
+            self._system_bounds = [
+                [locations[COLUMN.LAT].min(), locations[COLUMN.LON].min()],
+                [locations[COLUMN.LAT].max(), locations[COLUMN.LON].max()],
+            ]
+
+        device_geojson = self._to_geojson(
+            locations,
+            properties=[COLUMN.DEVICEID, COLUMN.LABEL, COLUMN.ACTIVE],
+        )
+        self._device_features = {
+            feature["properties"][COLUMN.DEVICEID.value]: feature
+            for feature in device_geojson["features"]
+        }
 
     def _validate_data(self, locations: pd.DataFrame) -> None:
         """
         Check that required columns are present.
         """
-        assert COLUMN.LAT in locations.columns
-        assert COLUMN.LON in locations.columns
-        assert COLUMN.DEVICEID in locations.columns
-        assert COLUMN.ACTIVE in locations.columns
-        assert COLUMN.LABEL in locations.columns
+        missing = self.REQUIRED_COLUMNS.difference(locations.columns)
+        if missing:
+            raise ValueError(
+                f"Columns {sorted(col.value for col in missing)} missing from the locations."
+            )
 
     def _get_tile(self) -> dl.TileLayer:
         """
@@ -112,74 +157,86 @@ class LeafletMapManager:
 
         return tile_layer
 
+    @staticmethod
+    def _to_geojson(
+        locations: pd.DataFrame, properties: List[COLUMN]
+    ) -> Dict[str, object]:
+        """
+        Build a GeoJSON FeatureCollection with a point feature per location,
+        carrying the given columns as properties.
+        """
+        names = [column.value for column in properties]
+        values = zip(*[locations[column].tolist() for column in properties])
+        coordinates = zip(
+            locations[COLUMN.LON].tolist(), locations[COLUMN.LAT].tolist()
+        )
+
+        features = [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [lon, lat]},
+                "properties": dict(zip(names, row)),
+            }
+            for (lon, lat), row in zip(coordinates, values)
+        ]
+
+        return {"type": "FeatureCollection", "features": features}
+
     def _get_markers(
         self, device_id: str = None, radius: int = None, active: bool = True
-    ) -> List[dl.CircleMarker]:
+    ) -> dl.GeoJSON | dl.Circle | List:
         """
         Build the markers for the map.
         """
 
         if device_id:
-            selected_device = self.locations[
-                self.locations[COLUMN.DEVICEID] == device_id
-            ]
-
-            markers = [
-                dict(lat=lat, lon=lon, id=id, label=label, active=active)
-                for lat, lon, id, label, active in zip(
-                    selected_device[COLUMN.LAT],
-                    selected_device[COLUMN.LON],
-                    selected_device[COLUMN.DEVICEID],
-                    selected_device[COLUMN.LABEL],
-                    selected_device[COLUMN.ACTIVE],
-                )
-            ]
-            markers = dlx.dicts_to_geojson(markers)
-
-            if active:
-                color = self.config["map"]["marker_color_highlight"]
+            # a single location is drawn as a plain circle, no GeoJSON needed
+            feature = self._device_features.get(device_id)
+            if feature is None:
+                markers = []
             else:
-                color = self.config["map"]["marker_color_inactive"]
+                if active:
+                    color = self.config["map"]["marker_color_highlight"]
+                else:
+                    color = self.config["map"]["marker_color_inactive"]
 
-            radius = max(int(radius), int(self.config["map"]["radius-meter"]))
-
-            markers = dl.GeoJSON(
-                data=markers,
-                pointToLayer=self._point_to_layer_location_map,
-                onEachFeature=self._on_each_feature,
-                id=f"marker-{device_id}",
-                hideout={"radius": radius, "color": color},
-            )
-
-        else:
-            markers = [
-                dict(
-                    lat=lat,
-                    lon=lon,
-                    id=id,
-                    active=active,
-                    label=label,
-                    sending_data=sending_data,
+                radius = max(
+                    int(radius), int(self.config["map"]["radius-meter"])
                 )
-                for lat, lon, id, label, active, sending_data in zip(
-                    self.locations[COLUMN.LAT],
-                    self.locations[COLUMN.LON],
-                    self.locations[COLUMN.DEVICEID],
-                    self.locations[COLUMN.LABEL],
-                    self.locations[COLUMN.ACTIVE],
-                    self.locations[COLUMN.SENDING_DATA],
+
+                lon, lat = feature["geometry"]["coordinates"]
+                markers = dl.Circle(
+                    dl.Tooltip(
+                        content=self._get_tooltip(
+                            label=feature["properties"][COLUMN.LABEL.value],
+                            active=active,
+                        )
+                    ),
+                    center=[lat, lon],
+                    radius=radius,
+                    color=color,
+                    fillColor=color,
+                    fillOpacity=0.4,
+                    id=f"marker-{device_id}",
                 )
-            ]
-            markers = dlx.dicts_to_geojson(markers)
 
+        else:
             markers = dl.GeoJSON(
-                data=markers,
+                data=self._system_geojson,
                 pointToLayer=self._point_to_layer_system_map,
                 clusterToLayer=self._cluster_to_layer,
                 onEachFeature=self._on_each_feature,
                 cluster=True,
-                zoomToBounds=True,
                 zoomToBoundsOnClick=True,
+                hideout={
+                    "color_highlight": self.config["map"][
+                        "marker_color_highlight"
+                    ],
+                    "color_inactive": self.config["map"][
+                        "marker_color_inactive"
+                    ],
+                    "radius": int(self.config["map"]["radius-pixel"]),
+                },
                 id=COMPONENT_ID.map_markers,
             )
 
@@ -187,113 +244,27 @@ class LeafletMapManager:
 
         return markers
 
-    def _assign_on_each_feature(self) -> None:
-        """
-        Client-side hover template.
-        """
-        self._on_each_feature = assign(
-            """function(feature, layer, context){
-                if (feature.properties.sending_data) {{ 
-                    var active = "<b>Active Location</b>";
-                    }} else {{
-                    var active = "<b>Inactive Location</b>";
-                }};
-                if (feature.properties.label) {{
-                    var label = feature.properties.label;
-                }} else {{
-                    var label = "";
-                }};
-                if (!feature.properties.cluster) {{
-                    layer.bindTooltip(`${active}<br>${label}`)
-                }};
-            }"""
-        )
-
-    def _assign_cluster_to_layer(self) -> None:
-        """
-        How to render clusters on the map client-side?
-        """
-        self._cluster_to_layer = assign(
-            f"""function(feature, latlng, index, context){{
-                    // Modify icon background color.
-                    const scatterIcon = L.DivIcon.extend({{
-                        createIcon: function(oldIcon) {{
-                            let icon = L.DivIcon.prototype.createIcon.call(this, oldIcon);
-                            icon.style.backgroundColor = this.options.color;
-                            return icon;
-                        }}
-                    }})
-                    const leaves = index.getLeaves(feature.properties.cluster_id);
-                    var cluster_color = "{self.config["map"]["marker_color_inactive"]}";
-                    for (let i = 0; i < leaves.length; ++i) {{
-                        if (leaves[i].properties.sending_data) {{
-                            var cluster_color = "{self.config["map"]["marker_color_highlight"]}";
-                        }}
-                    }}
-                    // Render a circle with the number of leaves written in the center.
-                    const icon = new scatterIcon({{
-                        html: '<div style="background-color:white;"><span>' + feature.properties.point_count_abbreviated + '</span></div>',
-                        className: "marker-cluster",
-                        iconSize: L.point(40, 40),
-                        color: cluster_color
-                    }});
-                    return L.marker(latlng, {{icon : icon}})
-                }}"""
-        )
-
-    def _assign_point_to_layer_system_map(self) -> None:
-        """
-        How to render individual markers on the map client-side?
-        """
-        self._point_to_layer_system_map = assign(
-            f"""
-                function(feature, latlng, context){{
-                    if (feature.properties.sending_data){{
-                        var color = "{self.config["map"]["marker_color_highlight"]}";
-                    }} else {{
-                        var color = "{self.config["map"]["marker_color_inactive"]}";
-                    }};
-                    return L.circleMarker(latlng, 
-                    {{
-                        radius: {self.config["map"]["radius-pixel"]}, 
-                        fillColor: color, 
-                        fillOpacity: 0.8,
-                    }});  // render a simple circle marker
-                }}
-                """
-        )
-
-    def _assign_point_to_layer_location_map(self) -> str:
+    @staticmethod
+    def _get_tooltip(label: str, active: bool) -> str:
         """
-        How to render individual markers on the map client-side?
+        Server-side version of the onEachFeature hover template in assets/map.js,
+        with the same activity status as the marker color.
         """
+        if active:
+            status = "<b>Active Location</b>"
+        else:
+            status = "<b>Inactive Location</b>"
 
-        self._point_to_layer_location_map = assign(
-            f"""
-                function(feature, latlng, context){{
-                    return L.circle(latlng, 
-                    {{
-                        radius: context.hideout["radius"], 
-                        color: context.hideout["color"], 
-                        fillColor: context.hideout["color"], 
-                        fillOpacity: 0.4
-                    }});  // render a simple circle marker
-                }}
-                """
-        )
+        return f"{status}<br>{label or ''}"
 
     def _get_map_center(self, device_id: str = None) -> tuple[float]:
         """
         Read the map center from the configs.
         """
-        if device_id:
-            device_row = self.locations[
-                self.locations[COLUMN.DEVICEID] == device_id
+        if device_id in self._device_features:
+            lon, lat = self._device_features[device_id]["geometry"][
+                "coordinates"
             ]
-
-        if device_id and device_row.shape[0] > 0:
-            lat = list(device_row[COLUMN.LAT])[0]
-            lon = list(device_row[COLUMN.LON])[0]
         else:
             lat = float(self.config["constants"]["map_center_lat"])
             lon = float(self.config["constants"]["map_center_lon"])
@@ -303,15 +274,25 @@ class LeafletMapManager:
     def get_map(
         self,
         device_id: str = None,
-        style: dict = {"height": "100vh"},
+        style: dict = None,
         radius: int = None,
         active: bool = True,
     ) -> dl.Map:
         """
-        Create the location map.
+        Create the location map, full height unless a style is given.
         """
+        if style is None:
+            style = {"height": "100vh"}
 
-        zoom = self._get_zoom(default=(device_id is None))
+        # bounds computed server-side, fitting them client-side would build
+        # a leaflet layer per location, dl.Map ignores them given a center
+        if device_id is None and self._system_bounds is not None:
+            view = {"bounds": self._system_bounds}
+        else:
+            view = {
+                "center": self._get_map_center(device_id=device_id),
+                "zoom": self._get_zoom(default=(device_id is None)),
+            }
 
         map = dl.Map(
             [
@@ -323,9 +304,11 @@ class LeafletMapManager:
                 ),
                 dl.GestureHandling(),
             ],
-            center=self._get_map_center(device_id=device_id),
-            zoom=zoom,
+            **view,
             style=style,
+            # draw the system map circle markers on a shared canvas
+            # instead of an SVG element per location
+            preferCanvas=(device_id is None),
             id=COMPONENT_ID.system_map,
         )
 
@@ -425,10 +408,6 @@ class AdminComponentManager(AbstractComponentManager):
     Manage components for the admin page.
     """
 
-    def __init__(self) -> None:
-        super().__init__()
-        self.data_formatter = DataFormatter()
-
     def get_data_table(self, admin_df: pd.DataFrame) -> dash_table.DataTable:
         """
         Create a data table component with devices sending data actively highlighted.
@@ -443,13 +422,17 @@ class AdminComponentManager(AbstractComponentManager):
         admin_df = admin_df.sort_values(
             COLUMN.LATEST_TIMESTAMP, ascending=False
         )
-        admin_df_plain = self.data_formatter._enum_col_names_to_string(
-            admin_df
-        )
+        admin_df_plain = DataFormatter._enum_col_names_to_string(admin_df)
 
         table = dash_table.DataTable(
             data=admin_df_plain.to_dict("records"),
             sort_action="native",
+            # only render the rows in view, the full table gets long
+            virtualization=True,
+            page_action="none",
+            fixed_rows={"headers": True},
+            style_table={"height": "60vh", "overflowY": "auto"},
+            style_cell={"minWidth": "120px"},
             style_data_conditional=[
                 {
                     "if": {
@@ -495,7 +478,7 @@ class LocationComponentManager(AbstractComponentManager):
         self.data_manager = data_manager
 
     def get_card(
-        self, title: str, body: object, logo: str, style: dict = dict()
+        self, title: str, body: object, logo: str, style: dict = None
     ):
         """
         Create a dbc.Card() component with the given title, body and fontawesome logo.
@@ -519,15 +502,31 @@ class LocationComponentManager(AbstractComponentManager):
 
         return card
 
+    def _get_loading(
+        self, component: object, loading_output_id: COMPONENT_ID
+    ) -> dcc.Loading:
+        """
+        Wrap a component in a loading overlay, which is also shown while
+        the data store is loading through the given output.
+        """
+        loading = dcc.Loading(
+            children=[component, html.Div(id=loading_output_id)],
+            type="circle",
+            overlay_style={"visibility": "visible", "filter": "blur(2px)"},
+        )
+
+        return loading
+
     def _get_noise_line_graph(
         self,
         component_id: COMPONENT_ID,
+        bold_line: bool = False,
     ) -> dcc.Graph:
         """
         Create an empty noise graph component which can be updated using callbacks.
         """
         noise_line_graph = dcc.Graph(
-            figure=go.Figure(),
+            figure=TimeseriesPlotter(None).plot(bold_line=bold_line),
             id=component_id,
             style={"visibility": "hidden"},
         )
@@ -542,7 +541,7 @@ class LocationComponentManager(AbstractComponentManager):
             COMPONENT_ID.raw_noise_line_graph
         )
         hourly_noise_line_graph = self._get_noise_line_graph(
-            COMPONENT_ID.hourly_noise_line_graph
+            COMPONENT_ID.hourly_noise_line_graph, bold_line=True
         )
 
         ### Date Picker ###
@@ -565,13 +564,9 @@ class LocationComponentManager(AbstractComponentManager):
                     [
                         dbc.Col(
                             [
-                                dcc.Loading(
-                                    children=[
-                                        hourly_noise_line_graph,
-                                        html.Div(id=COMPONENT_ID.data_store_loading_output1),
-                                        ],
-                                    type="circle",
-                                    overlay_style={"visibility":"visible", "filter": "blur(2px)"},
+                                self._get_loading(
+                                    hourly_noise_line_graph,
+                                    COMPONENT_ID.data_store_loading_output1,
                                 )
                             ],
                             lg=12,
@@ -583,13 +578,9 @@ class LocationComponentManager(AbstractComponentManager):
                     [
                         dbc.Col(
                             [
-                                dcc.Loading(
-                                    children=[
-                                        raw_noise_line_graph,
-                                        html.Div(id=COMPONENT_ID.data_store_loading_output2),
-                                        ],
-                                    type="circle",
-                                    overlay_style={"visibility":"visible", "filter": "blur(2px)"},
+                                self._get_loading(
+                                    raw_noise_line_graph,
+                                    COMPONENT_ID.data_store_loading_output2,
                                 )
                             ],
                             lg=12,
@@ -618,14 +609,9 @@ class LocationComponentManager(AbstractComponentManager):
             id=COMPONENT_ID.mean_indicator,
         )
 
-        indicator = dcc.Loading(
-                [
-                    indicator,
-                    html.Div(id=COMPONENT_ID.data_store_loading_output3),
-                ],
-                type="circle",
-                overlay_style={"visibility":"visible", "filter": "blur(2px)"},
-            )
+        indicator = self._get_loading(
+            indicator, COMPONENT_ID.data_store_loading_output3
+        )
 
         indicator_tooltip = dbc.Tooltip(
             f"Average noise level in the past hour and relative change since the hour prior.",
@@ -644,7 +630,7 @@ class LocationComponentManager(AbstractComponentManager):
             title="Hourly Noise Trend",
             body=dbc.CardBody(
                 [
-                    html.Span(id=COMPONENT_ID.last_update_text),
+                    html.H5(id=COMPONENT_ID.last_update_text),
                     html.Br(),
                     html.Br(),
                     self._get_mean_indicator(),
@@ -664,9 +650,8 @@ class LocationComponentManager(AbstractComponentManager):
             self.data_manager.location_stats is not None
         ), "No location stats loaded, cannot get start date."
         start = self.data_manager.location_stats.loc[0, COLUMN.START]
-        start = date(start.year, start.month, start.day)
 
-        return start
+        return start.date()
 
     def _get_location_end_date(self) -> date:
         """
@@ -676,9 +661,8 @@ class LocationComponentManager(AbstractComponentManager):
             self.data_manager.location_stats is not None
         ), "No location stats loaded, cannot get end date."
         end = self.data_manager.location_stats.loc[0, COLUMN.END]
-        end = date(end.year, end.month, end.day)
 
-        return end
+        return end.date()
 
     def _get_date_controls(
         self,
@@ -702,6 +686,8 @@ class LocationComponentManager(AbstractComponentManager):
             end_date=end_default,
             min_date_allowed=min_date_allowed,
             max_date_allowed=max_date_allowed,
+            # only update once both dates are picked to avoid double loads
+            updatemode="bothdates",
         )
 
         return html.Div(range_picker)
@@ -730,25 +716,24 @@ class CallbackManager:
 
     def __init__(self, data_manager: AppDataManager) -> None:
         self.data_manager = data_manager
-        self.data_formatter = DataFormatter()
+        # share the data manager's formatter
+        self.data_formatter = data_manager.data_formatter
 
     def initialize_callbacks(self):
-        def _update_fig_with_layout(relayout_data: dict, figure: dict) -> None:
+        def _patch_line_chart(df: pd.DataFrame) -> Patch:
             """
-            Copy x-axis layout attributes into the figure.
+            Swap the data of the line chart traces, keeping the layout already on the page.
             """
-            if "xaxis.range[0]" in relayout_data:
-                xmin = relayout_data["xaxis.range[0]"]
-                xmax = relayout_data["xaxis.range[1]"]
-                figure["layout"]["xaxis"]["range"] = [xmin, xmax]
-                figure["layout"]["xaxis"]["autorange"] = False
-            elif (
-                "xaxis.autorange" in relayout_data
-                and relayout_data["xaxis.autorange"] == True
-            ):
-                figure["layout"]["xaxis"]["autorange"] = True
-            else:
-                pass
+            patched_figure = Patch()
+            trace_data = TimeseriesPlotter(df).get_trace_data()
+            for i, data in enumerate(trace_data):
+                patched_figure["data"][i]["x"] = data["x"]
+                patched_figure["data"][i]["y"] = data["y"]
+
+            # reset any zoom left over from the previous date range
+            patched_figure["layout"]["xaxis"]["autorange"] = True
+
+            return patched_figure
 
         @callback(
             Output(COMPONENT_ID.download_csv, "data"),
@@ -758,49 +743,40 @@ class CallbackManager:
         def download_button_callback(n_clicks):
             # extract data
             noise_df = self.data_manager.location_noise[Granularity.raw]
-            noise_df = (
-                self.data_manager.data_formatter._enum_col_names_to_string(
-                    noise_df
-                )
-            )
+            noise_df = self.data_formatter._enum_col_names_to_string(noise_df)
 
             # date as index
             noise_df = noise_df.set_index(COLUMN.TIMESTAMP.value)
 
             id = self.data_manager.device_id
-            start = date_to_string(min(noise_df.index))
-            end = date_to_string(max(noise_df.index))
+            start = date_to_string(noise_df.index.min())
+            end = date_to_string(noise_df.index.max())
             file_name = f"noise_data_ID{id}_{start}_to_{end}.csv"
 
             return dcc.send_data_frame(noise_df.to_csv, file_name)
 
-        @callback(
-            Output(COMPONENT_ID.hourly_data_store, "data"),
-            Input(COMPONENT_ID.raw_data_store, "data"),
-        )
-        def aggregate_raw_to_hourly(
-            raw_data: List[Dict[str, object]]
-        ) -> List[Dict[str, object]]:
+        def _aggregate_raw_to_hourly(raw_df: pd.DataFrame) -> pd.DataFrame:
             """
             Take the raw data and resample to hourly.
             """
-            raw_df = self.data_formatter.store_to_dataframe(raw_data)
-
-            # aggregate
-            raw_df = raw_df.set_index(COLUMN.TIMESTAMP)
-            hourly_df = raw_df.resample("1H").agg(
-                {COLUMN.MEAN: "mean", COLUMN.MIN: "min", COLUMN.MAX: "max"}
+            # resample keeps empty hours as gaps in the line charts,
+            # direct reductions skip the agg() dict dispatch
+            hours = raw_df.set_index(COLUMN.TIMESTAMP).resample("1H")
+            hourly_df = pd.DataFrame(
+                {
+                    COLUMN.MEAN: hours[COLUMN.MEAN].mean(),
+                    COLUMN.MIN: hours[COLUMN.MIN].min(),
+                    COLUMN.MAX: hours[COLUMN.MAX].max(),
+                }
             )
             hourly_df = hourly_df.reset_index()
 
-            self.data_manager.location_noise[Granularity.hourly] = hourly_df
-
-            hourly_data = self.data_formatter.dataframe_to_store(hourly_df)
-
-            return hourly_data
+            return hourly_df
 
         @callback(
             Output(COMPONENT_ID.raw_data_store, "data"),
+            Output(COMPONENT_ID.hourly_data_store, "data"),
+            Output(COMPONENT_ID.mean_indicator, "children"),
             Output(COMPONENT_ID.data_store_loading_output1, "children"),
             Output(COMPONENT_ID.data_store_loading_output2, "children"),
             Output(COMPONENT_ID.data_store_loading_output3, "children"),
@@ -809,14 +785,17 @@ class CallbackManager:
         )
         def load_data(
             start_date: date, end_date: date
-        ) -> List[Dict[str, object]]:
+        ) -> tuple[str, List[Dict[str, object]], html.Div, str, str, str]:
             """
-            Load data based on date picker into client-side raw data store.
+            Load data based on date picker into the client-side raw data store
+            and its hourly aggregate into the hourly data store.
+            The trend indicator is updated from the hourly aggregate as well.
             """
             device_id = self.data_manager.device_id
 
-            start_date = date.fromisoformat(start_date)
-            end_date = date.fromisoformat(end_date)
+            # picker values may carry a time part, only the date is needed
+            start_date = date.fromisoformat(start_date[:10])
+            end_date = date.fromisoformat(end_date[:10])
             end_date += timedelta(days=1)
 
             self.data_manager.load_and_format_location_noise(
@@ -826,10 +805,16 @@ class CallbackManager:
                 end=end_date,
             )
 
-            raw_data = self.data_manager.location_noise[Granularity.raw]
-            raw_data = self.data_formatter.dataframe_to_store(raw_data)
+            raw_df = self.data_manager.location_noise[Granularity.raw]
+            hourly_df = _aggregate_raw_to_hourly(raw_df)
+            self.data_manager.location_noise[Granularity.hourly] = hourly_df
+
+            indicator = MeanIndicatorPlotter(hourly_df).plot()
+
+            raw_data = self.data_formatter.dataframe_to_arrow_store(raw_df)
+            hourly_data = self.data_formatter.dataframe_to_store(hourly_df)
 
-            return raw_data, "", "", ""
+            return raw_data, hourly_data, indicator, "", "", ""
 
         @callback(
             Output(
@@ -850,82 +835,109 @@ class CallbackManager:
         )
         def update_line_charts(
             hourly_data: List[Dict[str, float]],
-            raw_data: List[Dict[str, float]],
+            raw_data: str,
         ):
             """
             Main callback responsible for loading data based on the date selector,
             updating the line charts and storing aggregate noise data.
             """
 
-            raw_data = self.data_formatter.store_to_dataframe(raw_data)
-            plotter = TimeseriesPlotter(raw_data)
-            raw_line_fig = plotter.plot(bold_line=False)
+            raw_data = self.data_formatter.arrow_store_to_dataframe(raw_data)
+            raw_line_fig = _patch_line_chart(raw_data)
 
             hourly_data = self.data_formatter.store_to_dataframe(hourly_data)
-            plotter = TimeseriesPlotter(hourly_data)
-            hourly_line_fig = plotter.plot(bold_line=True)
+            hourly_line_fig = _patch_line_chart(hourly_data)
 
             return hourly_line_fig, {}, raw_line_fig, {}
 
-        @callback(
+        clientside_callback(
+            """
+            function(data) {
+                // format the last timestamp as "%d %b %Y, %I:%M %p"
+                if (!data || !data.length) {
+                    return "";
+                }
+                var last = data[0].timestamp;
+                for (let i = 1; i < data.length; ++i) {
+                    if (data[i].timestamp > last) {
+                        last = data[i].timestamp;
+                    }
+                }
+                const months = [
+                    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+                    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"
+                ];
+                var hour = parseInt(last.slice(11, 13));
+                var period = hour < 12 ? "AM" : "PM";
+                hour = String(hour % 12 || 12).padStart(2, "0");
+                var day = last.slice(8, 10);
+                var month = months[parseInt(last.slice(5, 7)) - 1];
+                var year = last.slice(0, 4);
+                var minute = last.slice(14, 16);
+                return `Recorded at ${day} ${month} ${year}, ${hour}:${minute} ${period}`;
+            }
+            """,
             Output(COMPONENT_ID.last_update_text, "children"),
-            Output(COMPONENT_ID.mean_indicator, "children"),
             Input(COMPONENT_ID.hourly_data_store, "data"),
         )
-        def update_trend_indicator(data):
-            """
-            The indicator component is updated whenever new hourly data is loaded into the store.
-            Style needs to be cleared as it is set to invisible by default to avoid loading an empty chart.
-            """
-            data = pd.DataFrame(data)
-            data = self.data_formatter._string_col_names_to_enum(data)
-
-            plotter = MeanIndicatorPlotter(data)
-            indicator_fig = plotter.plot()
 
-            last_time = get_last_time(data)
-            update_text = (html.H5([f"Recorded at {last_time}"]),)
+        clientside_callback(
+            """
+            function(hourly_relout, raw_relout) {
+                // copy the x-axis range of the zoomed graph into the other one
+                var dc = window.dash_clientside;
+                var triggered = dc.callback_context.triggered_id;
+                var relout = null;
+                if (triggered === "%(hourly)s") {
+                    relout = hourly_relout;
+                } else if (triggered === "%(raw)s") {
+                    relout = raw_relout;
+                }
+                if (!relout) {
+                    return [dc.no_update, dc.no_update];
+                }
 
-            return update_text, indicator_fig
+                var patch = new dc.Patch();
+                if ("xaxis.range[0]" in relout) {
+                    patch.assign(
+                        ["layout", "xaxis", "range"],
+                        [relout["xaxis.range[0]"], relout["xaxis.range[1]"]]
+                    );
+                    patch.assign(["layout", "xaxis", "autorange"], false);
+                } else if (relout["xaxis.autorange"] === true) {
+                    patch.assign(["layout", "xaxis", "autorange"], true);
+                } else {
+                    return [dc.no_update, dc.no_update];
+                }
 
-        @callback(
+                if (triggered === "%(hourly)s") {
+                    return [dc.no_update, patch.build()];
+                }
+                return [patch.build(), dc.no_update];
+            }
+            """
+            % {
+                "hourly": COMPONENT_ID.hourly_noise_line_graph,
+                "raw": COMPONENT_ID.raw_noise_line_graph,
+            },
             Output(COMPONENT_ID.hourly_noise_line_graph, "figure"),
             Output(COMPONENT_ID.raw_noise_line_graph, "figure"),
             Input(COMPONENT_ID.hourly_noise_line_graph, "relayoutData"),
             Input(COMPONENT_ID.raw_noise_line_graph, "relayoutData"),
             prevent_initial_call=True,
         )
-        def update_zoom(hourly_relout, raw_relout):
-            """
-            Copy layout settings from one fig to other.
-            """
-            patched_raw = Patch()
-            patched_hourly = Patch()
-
-            if (
-                dash.ctx.triggered_id == COMPONENT_ID.raw_noise_line_graph
-                and isinstance(raw_relout, dict)
-            ):
-                _update_fig_with_layout(raw_relout, patched_hourly)
-
-            if (
-                dash.ctx.triggered_id == COMPONENT_ID.hourly_noise_line_graph
-                and isinstance(hourly_relout, dict)
-            ):
-                _update_fig_with_layout(hourly_relout, patched_raw)
-
-            return (patched_hourly, patched_raw)
 
         clientside_callback(
             """
             function(feature, n_clicks) {
                 var base_url = window.location.href;
-                console.log(feature)
                 if (!feature.properties.cluster) {
                     var url = new URL("locations/".concat(feature.properties.id), base_url);
                     console.log(`Redirecting to ${url}`);
                     window.open(url, '_blank');
                 }
+                // the hideout holds the marker colors, leave it as is
+                return window.dash_clientside.no_update;
             }
             """,
             Output(COMPONENT_ID.map_markers, "hideout"),
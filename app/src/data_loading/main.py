@@ -2,6 +2,8 @@
 Main data loading functionalities.
 """
 import re
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, Optional
 import pandas as pd
@@ -44,6 +46,11 @@ class AppDataManager:
 
         self.device_id: str = None
 
+        # noise requests cached per data manager, see _request_location_noise_cached()
+        self._location_noise_cache = functools.lru_cache(maxsize=32)(
+            self._request_location_noise_at
+        )
+
     def _create_api(self, url: str = None) -> NoiseApi:
         """
         Create noise api for data loading.
@@ -103,6 +110,47 @@ class AppDataManager:
 
         return noise_df
 
+    def _request_location_noise_at(
+        self,
+        location_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        granularity: Granularity,
+        last_record_time: datetime,
+    ) -> pd.DataFrame:
+        """
+        Noise request as of the last record time at the location. The last record time
+        is only part of the cache key so that new measurements invalidate the cached data.
+        """
+        return self._request_location_noise(
+            self.api,
+            location_id=location_id,
+            start_time=start_time,
+            end_time=end_time,
+            granularity=granularity,
+        )
+
+    def _request_location_noise_cached(
+        self,
+        location_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        granularity: Granularity,
+        last_record_time: datetime,
+    ) -> pd.DataFrame:
+        """
+        Cached noise request, returning a copy so the cached dataframe is never modified.
+        """
+        noise_df = self._location_noise_cache(
+            location_id=location_id,
+            start_time=start_time,
+            end_time=end_time,
+            granularity=granularity,
+            last_record_time=last_record_time,
+        )
+
+        return noise_df.copy()
+
     def load_and_format_location_info(self, location_id: str) -> pd.DataFrame:
         """
         Load and format the device location info for one location.
@@ -249,6 +297,23 @@ class AppDataManager:
 
         return stats
 
+    def load_and_format_location(self, location_id: str) -> None:
+        """
+        Load the life-time stats and the info for one location,
+        issuing the two independent API requests concurrently.
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            stats_future = executor.submit(
+                self.load_and_format_location_stats, location_id=location_id
+            )
+            info_future = executor.submit(
+                self.load_and_format_location_info, location_id=location_id
+            )
+
+            # re-raise request errors in the caller
+            stats_future.result()
+            info_future.result()
+
     def load_and_format_location_noise(
         self,
         location_id: str,
@@ -262,17 +327,18 @@ class AppDataManager:
         if self.location_stats is None:
             self.load_and_format_location_stats(location_id=location_id)
 
+        last_record_time = self.location_stats.loc[0, COLUMN.END]
         if end is None:
-            end = self.location_stats.loc[0, COLUMN.END]
+            end = last_record_time
         if start is None:
             start = end - timedelta(days=7)
 
-        noise_data = self._request_location_noise(
-            self.api,
+        noise_data = self._request_location_noise_cached(
             location_id=location_id,
             start_time=start,
             end_time=end,
             granularity=granularity,
+            last_record_time=last_record_time,
         )
         noise_data = self.data_formatter._string_col_names_to_enum(noise_data)
         noise_data = self.data_formatter._set_data_types(noise_data)
@@ -24,6 +24,9 @@ class NoiseApi:
     def __init__(self, url: str):
         self.url = url
 
+        # shared client to pool connections across requests
+        self.client = httpx.Client()
+
     def _get(self, endpoint: str, params: NoiseRequestParams = None) -> dict:
         """
         Get data from the API and return as a json/dict.
@@ -35,7 +38,7 @@ class NoiseApi:
             else None
         )
 
-        response = httpx.get(full_url, params=params)
+        response = self.client.get(full_url, params=params)
         logger.info(f"GET Request: {response.url}")
 
         response.raise_for_status()
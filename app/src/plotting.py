@@ -14,7 +14,6 @@ import json
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
 from typing import Optional, List, Dict
 from abc import abstractmethod
 import pandas.api.types as ptype
@@ -128,8 +127,8 @@ class BasePlotter:
         Extract the start/end date from the data.
         """
         date_format = "%Y-%m-%d"
-        self.start_date = min(self.df[COLUMN.TIMESTAMP]).strftime(date_format)
-        self.end_date = max(self.df[COLUMN.TIMESTAMP]).strftime(date_format)
+        self.start_date = self.df[COLUMN.TIMESTAMP].min().strftime(date_format)
+        self.end_date = self.df[COLUMN.TIMESTAMP].max().strftime(date_format)
 
     @abstractmethod
     def _validate_data(self, df: pd.DataFrame) -> None:
@@ -163,6 +162,9 @@ class HistogramPlotter(BasePlotter):
         Create a histogram for the min/max values.
         """
 
+        # plotly.express is slow to import and only needed here
+        import plotly.express as px
+
         long_df = self._preprocess_data_for_histogram()
 
         fig = px.histogram(
@@ -245,10 +247,11 @@ class TimeseriesPlotter(BasePlotter):
             self._config["constants"]["noise_threshold"]
         )
 
-        self.set_start_end_date()
-        self.outliers = filter_outliers(
-            self.df, threshold=self.noise_threshold
-        )
+        if self.df is not None:
+            self.set_start_end_date()
+            self.outliers = filter_outliers(
+                self.df, threshold=self.noise_threshold
+            )
 
     def _validate_data(self, df: pd.DataFrame) -> None:
         for column in [COLUMN.MIN, COLUMN.MAX, COLUMN.MEAN, COLUMN.TIMESTAMP]:
@@ -266,15 +269,24 @@ class TimeseriesPlotter(BasePlotter):
         Params:
         title: str - if the title is added
         bold_line: bool - if extra emphasis is put on the mean line
-        """
-        figure = go.Figure()
 
-        figure.add_traces(
-            [
-                self._get_min_line_trace(),
-                self._get_max_line_trace(),
-                self._get_mean_line_trace(bold_line=bold_line),
-                self._get_final_marker(),
+        Without data the traces are left empty, to be filled in later from get_trace_data.
+        """
+        if self.df is None:
+            min_data, max_data, mean_data, final_data = [
+                {"x": [], "y": []}
+            ] * 4
+        else:
+            min_data, max_data, mean_data, final_data = self.get_trace_data()
+
+        # passing the traces to the constructor skips the deep copy
+        # add_traces() makes of every trace and its timestamp array
+        figure = go.Figure(
+            data=[
+                self._get_min_line_trace(min_data),
+                self._get_max_line_trace(max_data),
+                self._get_mean_line_trace(mean_data, bold_line=bold_line),
+                self._get_final_marker(final_data),
             ]
         )
 
@@ -301,16 +313,33 @@ class TimeseriesPlotter(BasePlotter):
 
         return figure
 
-    def _get_final_marker(self) -> go.Scatter:
+    def get_trace_data(self) -> List[Dict[str, pd.Series]]:
         """
-        Add a single marker for the last observation.
+        Get the x/y values of the min, max, mean and final marker traces, in the order they are plotted.
         """
         last_df = self.df.sort_values(
             by=COLUMN.TIMESTAMP, ascending=False
         ).head(1)
+
+        trace_data = [
+            {"x": self.df[COLUMN.TIMESTAMP], "y": self.df[column].round(1)}
+            for column in [COLUMN.MIN, COLUMN.MAX, COLUMN.MEAN]
+        ]
+        trace_data.append(
+            {
+                "x": last_df[COLUMN.TIMESTAMP],
+                "y": last_df[COLUMN.MEAN].round(1),
+            }
+        )
+
+        return trace_data
+
+    def _get_final_marker(self, data: Dict[str, pd.Series]) -> go.Scatter:
+        """
+        Add a single marker for the last observation.
+        """
         trace = go.Scatter(
-            x=last_df[COLUMN.TIMESTAMP],
-            y=last_df[COLUMN.MEAN],
+            **data,
             name="outlier",
             mode="markers",
             marker=dict(
@@ -336,10 +365,9 @@ class TimeseriesPlotter(BasePlotter):
 
         return trace
 
-    def _get_max_line_trace(self) -> go.Scatter:
+    def _get_max_line_trace(self, data: Dict[str, pd.Series]) -> go.Scatter:
         trace = go.Scatter(
-            x=self.df[COLUMN.TIMESTAMP],
-            y=self.df[COLUMN.MAX].round(1),
+            **data,
             name="Max",
             mode="lines",
             line_color=self.colors[COLOR_ITEM.MAX],
@@ -349,24 +377,24 @@ class TimeseriesPlotter(BasePlotter):
 
         return trace
 
-    def _get_min_line_trace(self) -> go.Scatter:
+    def _get_min_line_trace(self, data: Dict[str, pd.Series]) -> go.Scatter:
         trace = go.Scatter(
-            x=self.df[COLUMN.TIMESTAMP],
-            y=self.df[COLUMN.MIN].round(1),
+            **data,
             name="Min",
             mode="lines",
             line_color=self.colors[COLOR_ITEM.MIN],
         )
         return trace
 
-    def _get_mean_line_trace(self, bold_line: bool) -> go.Scatter:
+    def _get_mean_line_trace(
+        self, data: Dict[str, pd.Series], bold_line: bool
+    ) -> go.Scatter:
         line_width = int(self._config["plot.sizes"]["mean_line_width"])
         if bold_line:
             line_width += 3
 
         trace = go.Scatter(
-            x=self.df[COLUMN.TIMESTAMP],
-            y=self.df[COLUMN.MEAN].round(1),
+            **data,
             name="Mean",
             mode="lines",
             line_color=self.colors[COLOR_ITEM.MEAN],
@@ -454,6 +482,9 @@ class HeatmapPlotter(BasePlotter):
         """
         Create a heatmap from the pivot table.
         """
+        # plotly.express is slow to import and only needed here
+        import plotly.express as px
+
         pivot_column = pivot_value.value
         pivot_table = self._pivot(value=pivot_column)
 
@@ -571,6 +602,11 @@ class MeanIndicatorPlotter(AbstractIndicatorPlotter):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
+        # the two most recent rows, sorted once for both means
+        self.latest_df = self.df.sort_values(
+            by=COLUMN.TIMESTAMP, ascending=False
+        ).head(2)
+
     def _validate_data(self, df: pd.DataFrame) -> None:
         for col in [COLUMN.MEAN, COLUMN.TIMESTAMP]:
             assert col in df.columns
@@ -579,21 +615,13 @@ class MeanIndicatorPlotter(AbstractIndicatorPlotter):
         """
         Get the last mean from the dataset.
         """
-        df_sorted = self.df.sort_values(
-            by=COLUMN.TIMESTAMP, ascending=False
-        ).head(1)
-
-        return df_sorted[COLUMN.MEAN].values[0]
+        return self.latest_df[COLUMN.MEAN].values[0]
 
     def _get_reference_mean(self) -> float:
         """
         Get previous noise value, if available.
         """
-        df_sorted = self.df.sort_values(
-            by=COLUMN.TIMESTAMP, ascending=False
-        ).head(2)
-
-        return df_sorted[COLUMN.MEAN].values[-1]
+        return self.latest_df[COLUMN.MEAN].values[-1]
 
     def _get_title(self) -> str:
         """
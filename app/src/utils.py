@@ -3,12 +3,15 @@ General utilities.
 """
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import base64
 from enum import Enum
 import os
 import logging
 import inspect
 import requests
 import configparser
+import functools
 import dash_bootstrap_components as dbc
 from pydantic import BaseModel
 from typing import List, Dict, Any
@@ -63,6 +66,15 @@ class COLUMN(Enum):
     OUTLIERCOUNT_PRIOR = "outlier_count_prior"
 
 
+# column renaming maps between the COLUMN enums and their string names
+column_enum_to_string = {
+    column_enum: column_enum.value for column_enum in COLUMN
+}
+column_string_to_enum = {
+    column_enum.value: column_enum for column_enum in COLUMN
+}
+
+
 class HEATMAP_VALUE(Enum):
     """
     Valuse that can be shown in the heatmap.
@@ -118,19 +130,11 @@ def date_to_string(date_object: date | datetime) -> str:
     return date_object.strftime("%Y-%m-%dT%H:%M:%S-04:00")
 
 
-def get_last_time(df: pd.DataFrame) -> str:
-    """
-    Get last time stamp from the dataframe.
-    """
-    recent_timestamp = pd.to_datetime(df[COLUMN.TIMESTAMP].max())
-    formatted_timestamp = recent_timestamp.strftime("%d %b %Y, %I:%M %p")
-
-    return formatted_timestamp
-
-
+@functools.lru_cache(maxsize=None)
 def load_config(config_path: str = None) -> configparser.ConfigParser:
     """
     Load a config file from the current dir or a given location.
+    The parsed config is cached per path, so repeated calls don't re-read the file.
     """
     config = configparser.ConfigParser()
     if config_path is None:
@@ -140,21 +144,6 @@ def load_config(config_path: str = None) -> configparser.ConfigParser:
     return config
 
 
-def get_date_string(
-    days_before_today: int = None, str_format: str = "%Y-%m-%d"
-) -> str:
-    """
-    Create date string in "%Y-%m-%d" formate
-    """
-    week_ago = pd.to_datetime("today")
-    if days_before_today:
-        week_ago -= pd.Timedelta(days=days_before_today)
-
-    week_ago = week_ago.strftime(str_format)
-
-    return week_ago
-
-
 def get_current_dir(__file__) -> str:
     """
     Get the path to the directory of the script.
@@ -196,6 +185,39 @@ class DataFormatter(object):
 
         return data
 
+    def dataframe_to_arrow_store(self, df: pd.DataFrame) -> str:
+        """
+        Turn a dataframe into base64 encoded Arrow IPC bytes for the client-side dcc.Store().
+        Much faster to decode server-side than json records for large data sets,
+        though it compresses worse than json records once the response is gzipped.
+        Noise levels are stored as float32, which is plenty for plotting.
+        """
+        float_cols = [
+            col for col in [COLUMN.MIN, COLUMN.MAX, COLUMN.MEAN] if col in df
+        ]
+        df = df.astype({col: "float32" for col in float_cols})
+        df = self._enum_col_names_to_string(df)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+
+        return base64.b64encode(sink.getvalue().to_pybytes()).decode()
+
+    def arrow_store_to_dataframe(self, data: str) -> pd.DataFrame:
+        """
+        Take base64 encoded Arrow IPC data from the client-side dcc.Store() and
+        turn into a dataframe with Enum column names and proper data types.
+        """
+        table = pa.ipc.open_stream(base64.b64decode(data)).read_all()
+
+        df = table.to_pandas()
+        df = self._string_col_names_to_enum(df)
+        df = self._set_data_types(df)
+
+        return df
+
     @staticmethod
     def _fill_missing_times(df: pd.DataFrame, freq: str) -> pd.DataFrame:
         """
@@ -219,9 +241,7 @@ class DataFormatter(object):
         """
         Map the string col names to enums, filter rest to only the enums.
         """
-        new_df = df.rename(
-            columns={column_enum.value: column_enum for column_enum in COLUMN}
-        )
+        new_df = df.rename(columns=column_string_to_enum, copy=False)
 
         new_df = new_df[[col for col in COLUMN if col in new_df.columns]]
 
@@ -232,9 +252,7 @@ class DataFormatter(object):
         """
         Map the COLUMN enums to their value in the column names.
         """
-        new_df = df.rename(
-            columns={col_enum: col_enum.value for col_enum in COLUMN}
-        )
+        new_df = df.rename(columns=column_enum_to_string, copy=False)
 
         return new_df
 
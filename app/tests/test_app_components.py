@@ -0,0 +1,58 @@
+from src.app_components import LeafletMapManager
+from src.utils import COLUMN
+import pytest
+import pandas as pd
+
+
+@pytest.fixture
+def map_manager() -> LeafletMapManager:
+    locations = pd.DataFrame(
+        {
+            COLUMN.DEVICEID: ["1", "2"],
+            COLUMN.LABEL: ["Location 1", "Location 2"],
+            COLUMN.LAT: [43.6, 43.7],
+            COLUMN.LON: [-79.4, -79.3],
+            COLUMN.ACTIVE: [True, False],
+            COLUMN.SENDING_DATA: [True, False],
+        }
+    )
+
+    map_manager = LeafletMapManager()
+    map_manager.set_locations(locations)
+
+    return map_manager
+
+
+def test_system_map_fits_bounds(map_manager: LeafletMapManager):
+    """
+    The system map is fit to the locations, dl.Map would ignore the bounds given a center and zoom.
+    """
+    map = map_manager.get_map().to_plotly_json()["props"]
+
+    assert map["bounds"] == [[43.6, -79.4], [43.7, -79.3]]
+    assert "center" not in map
+    assert "zoom" not in map
+
+
+def test_location_map_centers_on_device(map_manager: LeafletMapManager):
+    map = map_manager.get_map(device_id="2", radius=10).to_plotly_json()[
+        "props"
+    ]
+
+    assert map["center"] == (43.7, -79.3)
+    assert "bounds" not in map
+
+
+@pytest.mark.parametrize(
+    "active, status", [(True, "Active Location"), (False, "Inactive Location")]
+)
+def test_location_map_tooltip(
+    map_manager: LeafletMapManager, active: bool, status: str
+):
+    """
+    The tooltip shows the same activity status as the marker color.
+    """
+    map_manager.get_map(device_id="1", radius=10, active=active)
+    tooltip = map_manager.markers.children.content
+
+    assert tooltip == f"<b>{status}</b><br>Location 1"
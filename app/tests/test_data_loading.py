@@ -8,7 +8,8 @@ from src.data_loading.models import (
 )
 from src.data_loading.main import AppDataManager
 from src.data_loading.models import Granularity
-from src.utils import get_current_dir, pydantic_to_pandas, load_config
+from src.utils import get_current_dir, pydantic_to_pandas, load_config, COLUMN
+import pandas as pd
 import pytest
 import os
 from pydantic import ValidationError
@@ -187,3 +188,38 @@ def test_noise_api_measurements_hourly(noise_api: NoiseApi):
         index=False,
     )
     assert len(result.measurements) > 0
+
+
+def test_location_noise_cached(monkeypatch: pytest.MonkeyPatch):
+    """
+    Repeated loads of the same time frame make a single request and leave the cached data unchanged.
+    """
+    noise_df = pd.DataFrame(
+        {"timestamp": ["2024-01-01T12:00:00+00:00"], "mean": [50.0]}
+    )
+    requests = []
+
+    def request_location_noise(api, **kwargs):
+        requests.append(kwargs)
+        return noise_df
+
+    data_manager = AppDataManager()
+    data_manager.location_stats = pd.DataFrame(
+        {COLUMN.END: [pd.Timestamp("2024-01-02 00:00:00")]}
+    )
+    monkeypatch.setattr(
+        data_manager, "_request_location_noise", request_location_noise
+    )
+
+    for _ in range(3):
+        data_manager.load_and_format_location_noise(
+            location_id=V1_API_TEST_ID, granularity=Granularity.hourly
+        )
+
+    assert len(requests) == 1
+    pd.testing.assert_frame_equal(
+        noise_df,
+        pd.DataFrame(
+            {"timestamp": ["2024-01-01T12:00:00+00:00"], "mean": [50.0]}
+        ),
+    )
@@ -1,5 +1,5 @@
 import pandas as pd
-from src.utils import DataFormatter, COLUMN, date_to_string
+from src.utils import DataFormatter, COLUMN, date_to_string, load_config
 from src.data_loading.main import AppDataManager
 import pytest
 from datetime import datetime, date
@@ -61,3 +61,28 @@ def test_time_filling(data_formatter: DataFormatter):
             ]
         )
     )
+
+
+def test_load_config_cached():
+    """
+    Repeated config loads should return the same parsed object.
+    """
+    assert load_config() is load_config()
+
+
+def test_arrow_store_round_trip(data_formatter: DataFormatter):
+    df = data_formatter.format_dataframe(
+        pd.DataFrame(
+            {
+                "timestamp": ["2024-01-01T12:00:00-04:00"],
+                "min": [40.0],
+                "max": [60.0],
+                "mean": [50.0],
+            }
+        )
+    )
+
+    data = data_formatter.dataframe_to_arrow_store(df)
+    new_df = data_formatter.arrow_store_to_dataframe(data)
+
+    pd.testing.assert_frame_equal(df, new_df)
@@ -28,3 +28,11 @@ def test_hourly_noise_plot(dummy_hourly_data: pd.DataFrame):
 
     figure_out_path = os.path.join(CURRENT_DIR, "plots/hourly_noise_plot.html")
     fig.write_html(figure_out_path)
+
+
+def test_trace_data_matches_empty_plot(dummy_hourly_data: pd.DataFrame):
+    empty_fig = TimeseriesPlotter(None).plot()
+    trace_data = TimeseriesPlotter(dummy_hourly_data).get_trace_data()
+
+    assert len(empty_fig.data) == len(trace_data)
+    assert len(trace_data[0]["x"]) == dummy_hourly_data.shape[0]